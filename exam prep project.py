@@ -6,29 +6,102 @@ Course: Introduction to Problem Solving & Programming
 """
 
 import datetime
+import json
 import os
+import pickle
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+# Bump whenever the Exam attributes change so old pickle snapshots are ignored
+_CACHE_VERSION = 5
+
+# Score for each exam priority level (unknown levels count as Low)
+_PRIORITY_ORDER = {'High': 3, 'Medium': 2, 'Low': 1}.get
+
+def _today():
+    """Get today's date (callers snapshot it once per operation)"""
+    return datetime.date.today()
+
+def _priority_tuple(exam, today):
+    """Sort key for study priority as of today (higher means study first)"""
+    days_remaining = (exam.exam_date - today).days
+    priority_score = _PRIORITY_ORDER(exam.priority, 1)
+    
+    # Higher priority for exams with fewer days remaining:
+    # 3 within a week, 2 within two weeks, 1 otherwise
+    urgency_multiplier = 3 - (days_remaining > 7) - (days_remaining > 14)
+    
+    return (priority_score * urgency_multiplier, -days_remaining)
 
 class Exam:
     """
     Represents an exam with all preparation details
     """
+    __slots__ = ('subject', 'exam_date', 'topic_names', 'topic_completed', 'topic_importance',
+                 '_completed', 'priority', 'current_progress', 'created_date', '_days_remaining',
+                 '_progress_str', '_days_left_str')
+    
     def __init__(self, subject, exam_date, topics, priority="Medium", current_progress=0):
         self.subject = subject
         self.exam_date = exam_date
-        self.topics = topics  # List of topics to study
+        # Topics to study, kept as parallel arrays of name / completed flag / importance
+        self.topic_names = [t['name'] for t in topics]
+        self.topic_completed = array('b', [t['completed'] for t in topics])
+        self.topic_importance = [t['importance'] for t in topics]
+        self._completed = sum(self.topic_completed)
         self.priority = priority  # High, Medium, Low
         self.current_progress = current_progress  # Percentage 0-100
         self.created_date = datetime.date.today()
+        self._days_remaining = (None, 0)  # (date computed on, days remaining)
+        # Display strings, rebuilt when progress changes or the day rolls over
+        self._progress_str = None
+        self._days_left_str = (None, None)  # (date formatted on, text)
     
-    def get_days_remaining(self):
+    def get_days_remaining(self, today=None):
         """Calculate days remaining until exam"""
-        today = datetime.date.today()
-        return (self.exam_date - today).days
+        if today is None:
+            today = _today()
+        
+        computed_on, days = self._days_remaining
+        if computed_on != today:
+            days = (self.exam_date - today).days
+            self._days_remaining = (today, days)
+        return days
+    
+    @property
+    def progress_str(self):
+        """Progress formatted for display, e.g. '42.5%'"""
+        if self._progress_str is None:
+            self._progress_str = f"{self.current_progress:.1f}%"
+        return self._progress_str
+    
+    @property
+    def days_left_str(self):
+        """Days remaining formatted for display, e.g. '5 days left'"""
+        today = _today()
+        formatted_on, text = self._days_left_str
+        if formatted_on != today:
+            text = f"{self.get_days_remaining(today)} days left"
+            self._days_left_str = (today, text)
+        return text
+    
+    def _completed_count(self):
+        """Number of completed topics"""
+        return self._completed
+    
+    def complete_topic(self, topic_index):
+        """Mark a topic as completed and update progress"""
+        if not self.topic_completed[topic_index]:
+            self.topic_completed[topic_index] = True
+            self._completed += 1
+        self.update_progress()
     
     def get_study_recommendation(self):
         """Generate study recommendation based on days remaining"""
         days_remaining = self.get_days_remaining()
-        topics_remaining = len([t for t in self.topics if not t['completed']])
+        topics_remaining = len(self.topic_completed) - self._completed_count()
         
         if days_remaining <= 0:
             return "Exam is today or has passed!"
@@ -41,23 +114,26 @@ class Exam:
     
     def update_progress(self):
         """Calculate current progress percentage"""
-        if not self.topics:
+        self._progress_str = None
+        if not self.topic_completed:
             self.current_progress = 0
             return
         
-        completed_topics = len([t for t in self.topics if t['completed']])
-        total_topics = len(self.topics)
+        completed_topics = self._completed_count()
+        total_topics = len(self.topic_completed)
         self.current_progress = (completed_topics / total_topics) * 100
     
     def to_dict(self):
         """Convert exam to dictionary for storage"""
         return {
             'subject': self.subject,
-            'exam_date': self.exam_date.strftime("%Y-%m-%d"),
-            'topics': self.topics,
+            'exam_date': self.exam_date.isoformat(),
+            'topics': [{'name': name, 'completed': bool(completed), 'importance': importance}
+                       for name, completed, importance
+                       in zip(self.topic_names, self.topic_completed, self.topic_importance)],
             'priority': self.priority,
             'current_progress': self.current_progress,
-            'created_date': self.created_date.strftime("%Y-%m-%d")
+            'created_date': self.created_date.isoformat()
         }
 
 class StudyPlanGenerator:
@@ -66,130 +142,218 @@ class StudyPlanGenerator:
     """
     def __init__(self, data_file="exam_data.txt"):
         self.data_file = data_file
+        # Binary snapshot of the exams for faster startup
+        self.cache_file = os.path.splitext(data_file)[0] + ".pkl"
         self.exams = []
-        self.subjects = ['Mathematics', 'Physics', 'Chemistry', 'Biology', 
-                        'Computer Science', 'English', 'History', 'Geography']
+        # Exams sorted by exam date, with their dates in a parallel list for bisect
+        self._by_date = []
+        self._exam_dates = []
+        # Tuple keeps the display order, frozenset gives O(1) membership checks
+        self._subjects_tuple = ('Mathematics', 'Physics', 'Chemistry', 'Biology',
+                                'Computer Science', 'English', 'History', 'Geography')
+        self.subjects = frozenset(self._subjects_tuple)
+        # Bumped on every change to the exams; invalidates the cached query results
+        self._mutation = 0
+        self._priority_cache = (None, None, None)  # (today, mutation, result)
+        # Set when exams changed since the last save; see flush_if_dirty()
+        self._dirty = False
         self.load_data()
     
     def save_data(self):
         """Save exams data to file"""
         try:
-            with open(self.data_file, 'w') as f:
-                f.write("[EXAMS]\n")
-                for exam in self.exams:
-                    exam_data = exam.to_dict()
-                    # Save exam basic info
-                    f.write(f"EXAM_START\n")
-                    f.write(f"subject:{exam_data['subject']}\n")
-                    f.write(f"exam_date:{exam_data['exam_date']}\n")
-                    f.write(f"priority:{exam_data['priority']}\n")
-                    f.write(f"current_progress:{exam_data['current_progress']}\n")
-                    f.write(f"created_date:{exam_data['created_date']}\n")
-                    
-                    # Save topics
-                    f.write("topics_start\n")
-                    for topic in exam_data['topics']:
-                        completed = "1" if topic['completed'] else "0"
-                        f.write(f"topic:{topic['name']},{completed},{topic['importance']}\n")
-                    f.write("topics_end\n")
-                    f.write(f"EXAM_END\n")
+            # json.dump issues a write() per encoded chunk; encode once and write it in one go
+            data = json.dumps({'exams': [exam.to_dict() for exam in self.exams]})
+            with open(self.data_file, 'w', buffering=1 << 16) as f:
+                f.write(data)
+            self._save_cache()
+            self._dirty = False
             return True
-        except Exception as e:
+        except OSError as e:
             print(f"Error saving data: {e}")
             return False
     
+    def flush_if_dirty(self):
+        """Save exams data only if it changed since the last save"""
+        if not self._dirty:
+            return True
+        return self.save_data()
+    
+    def _data_file_signature(self):
+        """Identify the current data file contents by modification time and size"""
+        stat = os.stat(self.data_file)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _save_cache(self):
+        """Save a pickled snapshot of the exams next to the data file"""
+        try:
+            snapshot = (_CACHE_VERSION, self._data_file_signature(), self.exams)
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"Error saving cache: {e}")
+    
+    def _load_cache(self):
+        """Load exams from the pickle snapshot if it was taken of the current data file"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                version, signature, exams = pickle.load(f)
+            # Any other data file (e.g. a restored backup, even an older one) invalidates it
+            if version != _CACHE_VERSION or signature != self._data_file_signature():
+                return False
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                TypeError, ValueError):
+            return False
+        
+        self.exams = exams
+        self._by_date = sorted(exams, key=lambda exam: exam.exam_date)
+        self._exam_dates = [exam.exam_date for exam in self._by_date]
+        self._mutation += 1
+        return True
+    
+    def _index_exam(self, exam):
+        """Insert an exam into the date-sorted index"""
+        position = bisect_right(self._exam_dates, exam.exam_date)
+        self._exam_dates.insert(position, exam.exam_date)
+        self._by_date.insert(position, exam)
+    
     def load_data(self):
         """Load exams data from file"""
         if not os.path.exists(self.data_file):
             return
         
+        if self._load_cache():
+            return
+        
         try:
-            with open(self.data_file, 'r') as f:
-                lines = f.readlines()
+            # Read the file once; both formats are parsed from the same string
+            with open(self.data_file, 'r', buffering=1 << 16) as f:
+                text = f.read()
+            
+            if not text.strip():
+                return
+            if text.lstrip().startswith("[EXAMS]"):
+                # Data saved by older versions in the line-based format
+                self._load_legacy_data(text.splitlines())
+            else:
+                data = json.loads(text)
+                if not isinstance(data, dict) or not isinstance(data.get('exams', []), list):
+                    print("Error loading data: expected an object with an 'exams' list")
+                    return
+                for exam_data in data.get('exams', []):
+                    self._create_exam_from_data(exam_data)
+            self._save_cache()
+        except (OSError, ValueError) as e:
+            print(f"Error loading data: {e}")
+    
+    def _load_legacy_data(self, lines):
+        """Load exams from the old EXAM_START/EXAM_END text format"""
+        current_exam = None
+        reading_topics = False
+        
+        for line in lines:
+            line = line.strip()
+            
+            if line == "EXAM_START":
+                current_exam = {}
+            elif line == "EXAM_END" and current_exam:
+                self._create_exam_from_data(current_exam)
                 current_exam = None
+            elif line == "topics_start" and current_exam is not None:
+                reading_topics = True
+                current_exam['topics'] = []
+            elif line == "topics_end":
                 reading_topics = False
-                
-                for line in lines:
-                    line = line.strip()
-                    
-                    if line == "EXAM_START":
-                        current_exam = {}
-                    elif line == "EXAM_END" and current_exam:
-                        self._create_exam_from_data(current_exam)
-                        current_exam = None
-                    elif line == "topics_start":
-                        reading_topics = True
-                        current_exam['topics'] = []
-                    elif line == "topics_end":
-                        reading_topics = False
-                    elif current_exam is not None:
-                        if reading_topics and line.startswith("topic:"):
-                            topic_data = line[6:].split(',')
-                            if len(topic_data) == 3:
-                                topic = {
-                                    'name': topic_data[0],
-                                    'completed': topic_data[1] == "1",
-                                    'importance': topic_data[2]
-                                }
-                                current_exam['topics'].append(topic)
-                        else:
-                            parts = line.split(':', 1)
-                            if len(parts) == 2:
-                                key, value = parts
-                                current_exam[key] = value
-        except Exception as e:
-            print(f"Error loading data: {e}")
+            elif current_exam is not None:
+                if reading_topics and line.startswith("topic:"):
+                    topic_data = line[6:].split(',')
+                    if len(topic_data) == 3:
+                        topic = {
+                            'name': topic_data[0],
+                            'completed': topic_data[1] == "1",
+                            'importance': topic_data[2]
+                        }
+                        current_exam['topics'].append(topic)
+                else:
+                    parts = line.split(':', 1)
+                    if len(parts) == 2:
+                        key, value = parts
+                        current_exam[key] = value
+    
+    def _is_valid_exam_data(self, exam_data):
+        """Check that loaded exam data has the fields and types Exam expects"""
+        if not isinstance(exam_data, dict):
+            return False
+        
+        topics = exam_data.get('topics', [])
+        return (isinstance(exam_data.get('subject', ''), str)
+                and isinstance(exam_data.get('exam_date'), str)
+                and isinstance(exam_data.get('created_date'), str)
+                and isinstance(exam_data.get('priority', 'Medium'), str)
+                and isinstance(exam_data.get('current_progress', 0), (int, float, str))
+                and isinstance(topics, list)
+                and all(isinstance(t, dict)
+                        and isinstance(t.get('name'), str)
+                        and isinstance(t.get('completed'), bool)
+                        and isinstance(t.get('importance'), str)
+                        for t in topics))
     
     def _create_exam_from_data(self, exam_data):
         """Create Exam object from loaded data"""
+        if not self._is_valid_exam_data(exam_data):
+            print(f"Error creating exam: malformed exam entry {exam_data!r}")
+            return
+        
         try:
             subject = exam_data.get('subject', '')
-            exam_date = datetime.datetime.strptime(exam_data['exam_date'], "%Y-%m-%d").date()
+            exam_date = datetime.date.fromisoformat(exam_data['exam_date'])
             priority = exam_data.get('priority', 'Medium')
             current_progress = float(exam_data.get('current_progress', 0))
             topics = exam_data.get('topics', [])
             
             exam = Exam(subject, exam_date, topics, priority, current_progress)
-            exam.created_date = datetime.datetime.strptime(exam_data['created_date'], "%Y-%m-%d").date()
-            self.exams.append(exam)
-        except Exception as e:
+            exam.created_date = datetime.date.fromisoformat(exam_data['created_date'])
+        except (KeyError, ValueError) as e:
             print(f"Error creating exam: {e}")
+            return
+        
+        self.exams.append(exam)
+        self._index_exam(exam)
+        self._mutation += 1
     
     def add_exam(self, subject, exam_date, topics_list, priority="Medium"):
         """Add a new exam to track"""
         if subject not in self.subjects:
             return False, "Invalid subject"
         
-        try:
-            # Convert topics list to proper format
-            topics = []
-            for topic_name in topics_list:
-                topics.append({
-                    'name': topic_name,
-                    'completed': False,
-                    'importance': 'High'  # Default importance
-                })
-            
-            exam = Exam(subject, exam_date, topics, priority)
-            self.exams.append(exam)
-            self.save_data()
-            return True, f"Exam for {subject} added successfully!"
-        except Exception as e:
-            return False, f"Error adding exam: {e}"
+        # datetime.datetime is a date subclass but can't be compared with plain dates
+        if type(exam_date) is not datetime.date:
+            return False, f"Error adding exam: invalid exam date {exam_date!r}"
+        
+        # Convert topics list to proper format
+        topics = []
+        for topic_name in topics_list:
+            topics.append({
+                'name': topic_name,
+                'completed': False,
+                'importance': 'High'  # Default importance
+            })
+        
+        exam = Exam(subject, exam_date, topics, priority)
+        self._index_exam(exam)
+        self.exams.append(exam)
+        self._mutation += 1
+        self._dirty = True
+        return True, f"Exam for {subject} added successfully!"
     
     def get_upcoming_exams(self, days=30):
         """Get exams happening in the next specified days"""
-        today = datetime.date.today()
-        upcoming = []
+        today = _today()
         
-        for exam in self.exams:
-            days_remaining = exam.get_days_remaining()
-            if 0 <= days_remaining <= days:
-                upcoming.append(exam)
-        
-        # Sort by days remaining
-        upcoming.sort(key=lambda x: x.get_days_remaining())
-        return upcoming
+        # Exams are kept sorted by date, so the window is a slice
+        start = bisect_left(self._exam_dates, today)
+        end = bisect_right(self._exam_dates, today + datetime.timedelta(days=days))
+        return self._by_date[start:end]
     
     def generate_study_schedule(self, exam, study_hours_per_day=2):
         """Generate a detailed study schedule for an exam"""
@@ -197,11 +361,12 @@ class StudyPlanGenerator:
         if days_remaining <= 0:
             return "Exam has already passed or is today."
         
-        incomplete_topics = [t for t in exam.topics if not t['completed']]
-        
-        if not incomplete_topics:
+        if exam._completed_count() == len(exam.topic_completed):
             return "All topics completed! Focus on revision."
         
+        incomplete_topics = [name for name, completed in zip(exam.topic_names, exam.topic_completed)
+                             if not completed]
+        
         schedule = []
         schedule.append(f"Study Schedule for {exam.subject} ({days_remaining} days remaining)")
         schedule.append("=" * 50)
@@ -209,20 +374,14 @@ class StudyPlanGenerator:
         # Calculate topics per day
         topics_per_day = max(1, len(incomplete_topics) // days_remaining)
         
-        current_day = 1
-        topics_scheduled = 0
-        
-        while topics_scheduled < len(incomplete_topics) and current_day <= days_remaining:
-            day_topics = incomplete_topics[topics_scheduled:topics_scheduled + topics_per_day]
-            topics_names = [t['name'] for t in day_topics]
-            schedule.append(f"Day {current_day}: {', '.join(topics_names)}")
-            
-            topics_scheduled += len(day_topics)
-            current_day += 1
+        # Split the topics into one chunk per day, dropping any that don't fit before the exam
+        chunks = [incomplete_topics[i:i + topics_per_day]
+                  for i in range(0, len(incomplete_topics), topics_per_day)][:days_remaining]
+        schedule.extend(f"Day {day}: {', '.join(chunk)}" for day, chunk in enumerate(chunks, 1))
         
         # Add revision days if there's time
-        if current_day <= days_remaining:
-            revision_days = days_remaining - current_day + 1
+        if len(chunks) < days_remaining:
+            revision_days = days_remaining - len(chunks)
             schedule.append(f"Last {revision_days} day(s): Revision and practice tests")
         
         return "\n".join(schedule)
@@ -231,41 +390,37 @@ class StudyPlanGenerator:
         """Mark a topic as completed and update progress"""
         if 0 <= exam_index < len(self.exams):
             exam = self.exams[exam_index]
-            if 0 <= topic_index < len(exam.topics):
-                exam.topics[topic_index]['completed'] = True
-                exam.update_progress()
-                self.save_data()
+            if 0 <= topic_index < len(exam.topic_completed):
+                exam.complete_topic(topic_index)
+                self._mutation += 1
+                self._dirty = True
                 return True, "Topic marked as completed!"
         return False, "Invalid exam or topic index"
     
     def get_study_priority(self):
         """Get exams sorted by study priority"""
-        priority_order = {'High': 3, 'Medium': 2, 'Low': 1}
-        
-        def exam_priority(exam):
-            days_remaining = exam.get_days_remaining()
-            priority_score = priority_order.get(exam.priority, 1)
-            
-            # Higher priority for exams with fewer days remaining
-            if days_remaining <= 7:
-                urgency_multiplier = 3
-            elif days_remaining <= 14:
-                urgency_multiplier = 2
-            else:
-                urgency_multiplier = 1
-            
-            return (priority_score * urgency_multiplier, -days_remaining)
-        
-        return sorted(self.exams, key=exam_priority, reverse=True)
+        today = _today()
+        if self._priority_cache[:2] == (today, self._mutation):
+            return list(self._priority_cache[2])
+        
+        # Decorate-sort-undecorate so the keys are computed once against a single today
+        decorated = [(_priority_tuple(exam, today), exam) for exam in self.exams]
+        decorated.sort(key=itemgetter(0), reverse=True)
+        result = [exam for _, exam in decorated]
+        self._priority_cache = (today, self._mutation, result)
+        return list(result)
     
     def get_study_analytics(self):
         """Generate study analytics and insights"""
         if not self.exams:
             return "No exams to analyze. Add some exams to get started!"
         
-        total_exams = len(self.exams)
-        upcoming_exams = self.get_upcoming_exams(30)
-        total_upcoming = len(upcoming_exams)
+        # Single pass over the exams; everything below is derived from it
+        today = _today()
+        stats = [(exam.get_days_remaining(today), exam.current_progress, exam) for exam in self.exams]
+        
+        total_exams = len(stats)
+        total_upcoming = sum(1 for days, _, _ in stats if 0 <= days <= 30)
         
         analytics = []
         analytics.append("STUDY ANALYTICS & INSIGHTS")
@@ -274,23 +429,23 @@ class StudyPlanGenerator:
         analytics.append(f"Exams in next 30 days: {total_upcoming}")
         analytics.append("")
         
-        if upcoming_exams:
+        if total_upcoming:
             analytics.append("UPCOMING EXAMS PRIORITY:")
+            # Ranking comes from the cached priority list
             for i, exam in enumerate(self.get_study_priority()[:5], 1):
-                days = exam.get_days_remaining()
-                analytics.append(f"{i}. {exam.subject} - {days} days left - {exam.current_progress:.1f}% complete")
+                days = exam.get_days_remaining(today)
+                analytics.append(f"{i}. {exam.subject} - {days} days left - {exam.progress_str} complete")
         
         # Overall progress
-        if self.exams:
-            avg_progress = sum(exam.current_progress for exam in self.exams) / len(self.exams)
-            analytics.append(f"\nAverage completion: {avg_progress:.1f}%")
-            
-            if avg_progress < 30:
-                analytics.append("💡 Recommendation: Increase study pace!")
-            elif avg_progress < 70:
-                analytics.append("💡 Recommendation: Good progress, keep consistent!")
-            else:
-                analytics.append("💡 Recommendation: Excellent progress! Focus on revision.")
+        avg_progress = sum(progress for _, progress, _ in stats) / total_exams
+        analytics.append(f"\nAverage completion: {avg_progress:.1f}%")
+        
+        if avg_progress < 30:
+            analytics.append("💡 Recommendation: Increase study pace!")
+        elif avg_progress < 70:
+            analytics.append("💡 Recommendation: Good progress, keep consistent!")
+        else:
+            analytics.append("💡 Recommendation: Excellent progress! Focus on revision.")
         
         return "\n".join(analytics)
 
@@ -321,7 +476,7 @@ class ExamPlannerInterface:
         print("\n--- Add New Exam ---")
         
         # Display available subjects
-        print("Available Subjects:", ", ".join(self.planner.subjects))
+        print("Available Subjects:", ", ".join(self.planner._subjects_tuple))
         subject = input("Enter subject: ").strip()
         if subject not in self.planner.subjects:
             print("Invalid subject! Please choose from the list.")
@@ -330,7 +485,7 @@ class ExamPlannerInterface:
         # Get exam date
         try:
             date_str = input("Enter exam date (YYYY-MM-DD): ").strip()
-            exam_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+            exam_date = datetime.date.fromisoformat(date_str)
             
             if exam_date < datetime.date.today():
                 print("Exam date cannot be in the past!")
@@ -369,12 +524,14 @@ class ExamPlannerInterface:
             print("No upcoming exams in the next 30 days.")
             return
         
+        # Build the whole page and write it at once
+        lines = []
         for i, exam in enumerate(upcoming, 1):
-            days = exam.get_days_remaining()
-            print(f"{i}. {exam.subject} - {exam.exam_date} ({days} days left)")
-            print(f"   Progress: {exam.current_progress:.1f}% | Priority: {exam.priority}")
-            print(f"   Recommendation: {exam.get_study_recommendation()}")
-            print()
+            lines.append(f"{i}. {exam.subject} - {exam.exam_date} ({exam.days_left_str})")
+            lines.append(f"   Progress: {exam.progress_str} | Priority: {exam.priority}")
+            lines.append(f"   Recommendation: {exam.get_study_recommendation()}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_study_schedule(self):
         """Generate and display study schedule"""
@@ -416,9 +573,9 @@ class ExamPlannerInterface:
             
             exam = exams[exam_choice]
             print(f"\nTopics for {exam.subject}:")
-            for j, topic in enumerate(exam.topics, 1):
-                status = "✓" if topic['completed'] else "✗"
-                print(f"{j}. [{status}] {topic['name']}")
+            for j, (name, completed) in enumerate(zip(exam.topic_names, exam.topic_completed), 1):
+                status = "✓" if completed else "✗"
+                print(f"{j}. [{status}] {name}")
             
             topic_choice = int(input("Select topic number to mark completed: ")) - 1
             success, message = self.planner.mark_topic_completed(exam_choice, topic_choice)
@@ -442,12 +599,13 @@ class ExamPlannerInterface:
             print("No exams to display.")
             return
         
+        lines = []
         for i, exam in enumerate(priority_exams, 1):
-            days = exam.get_days_remaining()
-            print(f"{i}. {exam.subject} - {days} days left - {exam.priority} Priority")
-            print(f"   Progress: {exam.current_progress:.1f}%")
-            print(f"   {exam.get_study_recommendation()}")
-            print()
+            lines.append(f"{i}. {exam.subject} - {exam.days_left_str} - {exam.priority} Priority")
+            lines.append(f"   Progress: {exam.progress_str}")
+            lines.append(f"   {exam.get_study_recommendation()}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def view_all_exams(self):
         """Display all exams"""
@@ -456,51 +614,59 @@ class ExamPlannerInterface:
             print("No exams being tracked.")
             return
         
+        lines = []
         for i, exam in enumerate(self.planner.exams, 1):
             days = exam.get_days_remaining()
             status = "UPCOMING" if days > 0 else "PASSED"
-            print(f"{i}. {exam.subject} - {exam.exam_date} ({days} days - {status})")
-            print(f"   Progress: {exam.current_progress:.1f}% | Topics: {len(exam.topics)}")
-            completed = len([t for t in exam.topics if t['completed']])
-            print(f"   Completed: {completed}/{len(exam.topics)} topics")
-            print()
+            lines.append(f"{i}. {exam.subject} - {exam.exam_date} ({days} days - {status})")
+            lines.append(f"   Progress: {exam.progress_str} | Topics: {len(exam.topic_names)}")
+            completed = exam._completed_count()
+            lines.append(f"   Completed: {completed}/{len(exam.topic_names)} topics")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run(self):
         """Main application loop"""
         print("Welcome to Exam Preparation Planner!")
         print("Plan your studies effectively and ace your exams!")
         
-        while True:
-            self.display_main_menu()
-            choice = input("Enter your choice (1-8): ").strip()
-            
-            try:
-                if choice == '1':
-                    self.add_new_exam()
-                elif choice == '2':
-                    self.view_upcoming_exams()
-                elif choice == '3':
-                    self.generate_study_schedule()
-                elif choice == '4':
-                    self.mark_topic_completed()
-                elif choice == '5':
-                    self.show_study_analytics()
-                elif choice == '6':
-                    self.show_priority_list()
-                elif choice == '7':
-                    self.view_all_exams()
-                elif choice == '8':
-                    print("Thank you for using Exam Preparation Planner!")
-                    print("Good luck with your exams! 🎯")
+        try:
+            while True:
+                self.display_main_menu()
+                choice = input("Enter your choice (1-8): ").strip()
+                
+                try:
+                    if choice == '1':
+                        self.add_new_exam()
+                    elif choice == '2':
+                        self.view_upcoming_exams()
+                    elif choice == '3':
+                        self.generate_study_schedule()
+                    elif choice == '4':
+                        self.mark_topic_completed()
+                    elif choice == '5':
+                        self.show_study_analytics()
+                    elif choice == '6':
+                        self.show_priority_list()
+                    elif choice == '7':
+                        self.view_all_exams()
+                    elif choice == '8':
+                        print("Thank you for using Exam Preparation Planner!")
+                        print("Good luck with your exams! 🎯")
+                        break
+                    else:
+                        print("Invalid choice! Please enter 1-8.")
+                    
+                    # Save right after a change; read-only actions leave nothing to write
+                    self.planner.flush_if_dirty()
+                except KeyboardInterrupt:
+                    print("\n\nApplication interrupted. Saving data...")
                     break
-                else:
-                    print("Invalid choice! Please enter 1-8.")
-            except KeyboardInterrupt:
-                print("\n\nApplication interrupted. Saving data...")
-                self.planner.save_data()
-                break
-            except Exception as e:
-                print(f"An error occurred: {e}")
+                except Exception as e:
+                    print(f"An error occurred: {e}")
+        finally:
+            # Backstop for changes not yet written when the loop was left
+            self.planner.flush_if_dirty()
 
 def main():
     """Main function to start the application"""